@@ -1,11 +1,18 @@
 import ast
+import functools
+import json
 import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+CACHE_FILE = ".gen_docs_cache.json"
 
+
+@functools.lru_cache(maxsize=None)
 def slugify(text):
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
 
 
 def extract_docstrings_from_file(filepath):
@@ -19,20 +26,55 @@ def extract_docstrings_from_file(filepath):
     return extract_classes(tree)
 
 
+def load_cache(path):
+    """Load the {filepath: [mtime, classes]} parse cache, if present."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+def extract_docstrings_cached(filepaths, cache):
+    """Return the classes of each file in filepaths, in order.
+
+    Files whose mtime matches the cache are not re-parsed; the rest are
+    parsed in parallel worker processes.
+    """
+    mtimes = {fp: os.stat(fp).st_mtime for fp in filepaths}
+    stale = [fp for fp in filepaths if fp not in cache or cache[fp][0] != mtimes[fp]]
+    if stale:
+        with ProcessPoolExecutor() as ex:
+            parsed = ex.map(extract_docstrings_from_file, stale, chunksize=8)
+            for fp, classes in zip(stale, parsed):
+                cache[fp] = [mtimes[fp], classes]
+    return [cache[fp][1] for fp in filepaths]
+
+
+def _iter_classes(tree):
+    # Breadth-first over module and class bodies only (same order as
+    # ast.walk), without descending into function bodies. Only ClassDef
+    # nodes are queued, since nothing else can contain a documented class.
+    queue = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    for node in queue:
+        queue.extend(child for child in node.body if isinstance(child, ast.ClassDef))
+        yield node
+
+
 def extract_classes(tree):
     classes = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            class_name = node.name
-            class_doc = ast.get_docstring(node)
-            methods = []
-            for child in node.body:
-                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    method_doc = ast.get_docstring(child)
-                    if not method_doc:
-                        method_doc = ""
-                    methods.append((child.name, method_doc))
-            classes.append((class_name, class_doc, methods))
+    for node in _iter_classes(tree):
+        methods = [
+            (child.name, ast.get_docstring(child) or "")
+            for child in node.body
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        classes.append((node.name, ast.get_docstring(node), methods))
     return classes
 
 
@@ -44,15 +86,14 @@ def write_class_md(base_output_dir, folder, class_name, class_doc, methods):
     filepath = os.path.join(output_folder, f"{slug}.md")
     rel_slug = f"reference/{slugify(folder)}/{slug}"
 
+    parts = [f"---\ntitle: {class_name}\nslug: {rel_slug}\n---\n\n# {class_name}\n\n"]
+    if class_doc:
+        parts.append(class_doc + "\n\n")
+    if methods:
+        parts.append("## Methods\n\n")
+        parts.extend(f"### {name}()\n\n{doc}\n\n" for name, doc in methods)
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write(f"---\ntitle: {class_name}\nslug: {rel_slug}\n---\n\n")
-        f.write(f"# {class_name}\n\n")
-        if class_doc:
-            f.write(class_doc + "\n\n")
-        if methods:
-            f.write("## Methods\n\n")
-            for name, doc in methods:
-                f.write(f"### {name}()\n\n{doc}\n\n")
+        f.write("".join(parts))
     return slug, rel_slug
 
 
@@ -86,21 +127,25 @@ def generate_sidebar_groups(sidebar_groups):
 
 def main(src_dir, output_dir, dir):
     sidebar_groups = defaultdict(list)
+    cache_path = os.path.join(dir, CACHE_FILE)
+    cache = load_cache(cache_path)
 
+    jobs = []
     for dirpath, _, filenames in os.walk(src_dir):
         for fname in filenames:
             if fname.endswith(".py"):
                 filepath = os.path.join(dirpath, fname)
                 rel_dir = os.path.relpath(dirpath, src_dir)
                 rel_folder = rel_dir.split(os.sep)[-1] if rel_dir != "." else "root"
-                classes = extract_docstrings_from_file(filepath)
-                for class_name, class_doc, methods in classes:
-                    slug, rel_slug = write_class_md(
-                        output_dir, rel_folder, class_name, class_doc, methods
-                    )
-                    sidebar_groups[rel_folder].append(
-                        {"label": class_name, "slug": rel_slug}
-                    )
+                jobs.append((filepath, rel_folder))
+
+    all_classes = extract_docstrings_cached([fp for fp, _ in jobs], cache)
+    for (_, rel_folder), classes in zip(jobs, all_classes):
+        for class_name, class_doc, methods in classes:
+            slug, rel_slug = write_class_md(
+                output_dir, rel_folder, class_name, class_doc, methods
+            )
+            sidebar_groups[rel_folder].append({"label": class_name, "slug": rel_slug})
 
     sidebar_items = generate_sidebar_groups(sidebar_groups)
 
@@ -145,6 +190,7 @@ def main(src_dir, output_dir, dir):
     astro_dir = os.path.join(dir, "astro.config.mjs")
     with open(astro_dir, "w", encoding="utf-8") as f:
         f.write(astro_config)
+    save_cache(cache_path, cache)
 
     print("Markdown files written to:", output_dir)
     print("astro.config.mjs generated with nested sidebar")
@@ -1,12 +1,31 @@
-from .control import LemonInput
-from .lemonbot.lemon_robot import LemonRobot
-from .lemonbot.tunable import fms_feedback
-from .vision import LemonCamera
+import importlib
+
+# Public names are imported on first access (PEP 562) so that importing a
+# single submodule does not pull in wpilib, photonlibpy and magicbot.
+_LAZY = {
+    "LemonInput": ".control",
+    "LemonCamera": ".vision",
+    "LemonRobot": ".lemonbot.lemon_robot",
+    "fms_feedback": ".lemonbot.tunable",
+}
 
 __all__ = [
     "LemonInput",
     "LemonCamera",
     "LemonRobot",
     "fms_feedback",
-    "is_fms_attached",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
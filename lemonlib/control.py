@@ -7,6 +7,16 @@ from wpilib.interfaces import GenericHID
 RIGHT_RUMBLE = GenericHID.RumbleType.kRightRumble
 LEFT_RUMBLE = GenericHID.RumbleType.kLeftRumble
 
+# (x, y) for each 45 degree POV step, y negated as POV is flipped vertically
+_POV_TABLE = tuple(
+    (math.cos(math.radians(angle)), -math.sin(math.radians(angle)))
+    for angle in range(0, 360, 45)
+)
+
+
+def _noop(_):
+    """Shared setter for read-only sendable properties."""
+
 
 class LemonInput(GenericHID):
     """
@@ -69,6 +79,30 @@ class LemonInput(GenericHID):
         kX = 3
         kY = 4
 
+    _button_maps = {"Xbox": xbox_buttons, "PS5": ps5_buttons}
+
+    __slots__ = (
+        "button_map",
+        "contype",
+        # resolved indices, one per button_map member
+        "_kLeftTrigger",
+        "_kLeftX",
+        "_kLeftY",
+        "_kRightTrigger",
+        "_kRightX",
+        "_kRightY",
+        "_kA",
+        "_kB",
+        "_kBack",
+        "_kLeftBumper",
+        "_kLeftStick",
+        "_kRightBumper",
+        "_kRightStick",
+        "_kStart",
+        "_kX",
+        "_kY",
+    )
+
     def __init__(self, port: int = None, type: str = "auto"):
         """
         Initializes the control object with the specified port number and type.
@@ -100,19 +134,21 @@ class LemonInput(GenericHID):
 
         if type == "auto":
             if RobotBase.isSimulation() or DriverStation.getJoystickIsXbox(port):
-                self.button_map = self.xbox_buttons
-                self.contype = "Xbox"
+                type = "Xbox"
             else:
-                self.button_map = self.ps5_buttons
-                self.contype = "PS5"
+                type = "PS5"
 
-        elif type == "Xbox":
-            self.button_map = self.xbox_buttons
-            self.contype = "Xbox"
+        try:
+            self.button_map = self._button_maps[type]
+        except KeyError:
+            raise ValueError(
+                f"LemonInput type must be auto, Xbox or PS5 (not {type!r})"
+            ) from None
+        self.contype = type
 
-        elif type == "PS5":
-            self.button_map = self.ps5_buttons
-            self.contype = "PS5"
+        # resolve the button/axis indices once so getters skip the enum lookup
+        for name, member in self.button_map.__members__.items():
+            setattr(self, "_" + name, member.value)
 
     def getType(self):
         """Returns the type of controller (Xbox or PS5)."""
@@ -122,7 +158,7 @@ class LemonInput(GenericHID):
 
     def getLeftBumper(self):
         """Returns the state of the left bumper button."""
-        return self.getRawButton(self.button_map.kLeftBumper.value)
+        return self.getRawButton(self._kLeftBumper)
 
     def getRightBumper(self):
         """
@@ -131,7 +167,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the right bumper button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kRightBumper.value)
+        return self.getRawButton(self._kRightBumper)
 
     def getStartButton(self):
         """
@@ -140,7 +176,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the start button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kStart.value)
+        return self.getRawButton(self._kStart)
 
     def getBackButton(self):
         """
@@ -149,7 +185,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the back button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kBack.value)
+        return self.getRawButton(self._kBack)
 
     def getAButton(self):
         """
@@ -158,7 +194,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the 'A' button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kA.value)
+        return self.getRawButton(self._kA)
 
     def getBButton(self):
         """
@@ -167,7 +203,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the 'B' button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kB.value)
+        return self.getRawButton(self._kB)
 
     def getXButton(self):
         """
@@ -176,7 +212,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the 'X' button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kX.value)
+        return self.getRawButton(self._kX)
 
     def getYButton(self):
         """
@@ -185,7 +221,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the 'Y' button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kY.value)
+        return self.getRawButton(self._kY)
 
     def getLeftStickButton(self):
         """
@@ -194,7 +230,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the left stick button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kLeftStick.value)
+        return self.getRawButton(self._kLeftStick)
 
     def getRightStickButton(self):
         """
@@ -203,7 +239,7 @@ class LemonInput(GenericHID):
         Returns:
             bool: The state of the right stick button (pressed or not).
         """
-        return self.getRawButton(self.button_map.kRightStick.value)
+        return self.getRawButton(self._kRightStick)
 
     def getRightTriggerAxis(self) -> float:
         """
@@ -212,7 +248,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The state of the right trigger button ranging from 0.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kRightTrigger.value)
+        return self.getRawAxis(self._kRightTrigger)
 
     def getLeftTriggerAxis(self) -> float:
         """
@@ -221,57 +257,57 @@ class LemonInput(GenericHID):
         Returns:
             float: The state of the left trigger button ranging from 0.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kLeftTrigger.value)
+        return self.getRawAxis(self._kLeftTrigger)
 
     """PS5 funcs still work with Xbox just for ease of use"""
 
     def getL1Button(self):
         """Returns the state of the L1 button."""
-        return self.getRawButton(self.button_map.kLeftBumper.value)
+        return self.getRawButton(self._kLeftBumper)
 
     def getR1Button(self):
         """Returns the state of the R1 button."""
-        return self.getRawButton(self.button_map.kRightBumper.value)
+        return self.getRawButton(self._kRightBumper)
 
     def getOptionsButton(self):
         """Returns the state of the Options button."""
-        return self.getRawButton(self.button_map.kStart.value)
+        return self.getRawButton(self._kStart)
 
     def getCreateButton(self):
         """Returns the state of the Create button."""
-        return self.getRawButton(self.button_map.kBack.value)
+        return self.getRawButton(self._kBack)
 
     def getCrossButton(self):
         """Returns the state of the Cross (X) button."""
-        return self.getRawButton(self.button_map.kA.value)
+        return self.getRawButton(self._kA)
 
     def getCircleButton(self):
         """Returns the state of the Circle (O) button."""
-        return self.getRawButton(self.button_map.kB.value)
+        return self.getRawButton(self._kB)
 
     def getSquareButton(self):
         """Returns the state of the Square button."""
-        return self.getRawButton(self.button_map.kX.value)
+        return self.getRawButton(self._kX)
 
     def getTriangleButton(self):
         """Returns the state of the Triangle button."""
-        return self.getRawButton(self.button_map.kY.value)
+        return self.getRawButton(self._kY)
 
     def getL3(self):
         """Returns the state of the L3 (left stick) button."""
-        return self.getRawButton(self.button_map.kLeftStick.value)
+        return self.getRawButton(self._kLeftStick)
 
     def getR3(self):
         """Returns the state of the R3 (right stick) button."""
-        return self.getRawButton(self.button_map.kRightStick.value)
+        return self.getRawButton(self._kRightStick)
 
     def getR2Axis(self) -> float:
         """Returns the state of the R2 trigger."""
-        return self.getRawAxis(self.button_map.kRightTrigger.value)
+        return self.getRawAxis(self._kRightTrigger)
 
     def getL2Axis(self) -> float:
         """Returns the state of the L2 trigger."""
-        return self.getRawAxis(self.button_map.kLeftTrigger.value)
+        return self.getRawAxis(self._kLeftTrigger)
 
     """Both Xbox and PS5 funcs"""
 
@@ -300,7 +336,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The X-axis value of the left joystick, ranging from -1.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kLeftX.value)
+        return self.getRawAxis(self._kLeftX)
 
     def getLeftY(self) -> float:
         """
@@ -309,7 +345,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The Y-axis value of the left joystick, ranging from -1.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kLeftY.value)
+        return self.getRawAxis(self._kLeftY)
 
     def getRightX(self) -> float:
         """
@@ -318,7 +354,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The X-axis value of the right joystick, ranging from -1.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kRightX.value)
+        return self.getRawAxis(self._kRightX)
 
     def getRightY(self) -> float:
         """
@@ -327,12 +363,13 @@ class LemonInput(GenericHID):
         Returns:
             float: The Y-axis value of the right joystick, ranging from -1.0 to 1.0.
         """
-        return self.getRawAxis(self.button_map.kRightY)
+        return self.getRawAxis(self._kRightY)
 
-    def __pov_xy(self):
+    def getPovXY(self) -> tuple[float, float]:
         """
         Returns the X and Y values of the POV as a tuple using sin and cos,
-        or (0, 0) if the POV is not pressed (-1).
+        or (0, 0) if the POV is not pressed (-1). Reads the POV once, so
+        prefer this over getPovX() and getPovY() when both are needed.
 
         Returns:
             tuple: The X and Y values of the POV as a tuple.
@@ -343,17 +380,14 @@ class LemonInput(GenericHID):
         if pov_value == -1:
             return (0, 0)
 
-        # Convert POV value to radians
-        radians = math.radians(pov_value)
-
-        # Calculate X and Y using sin and cos
-        x = math.cos(radians)
-        y = -math.sin(
-            radians
-        )  # Negative because POV values are typically flipped vertically
+        # POV values are multiples of 45, so use the precomputed table
+        if pov_value % 45 == 0:
+            return _POV_TABLE[pov_value // 45 % 8]
 
-        # Return the calculated values
-        return (x, y)
+        # Calculate X and Y using sin and cos for any other angle
+        radians = math.radians(pov_value)
+        # Negative because POV values are typically flipped vertically
+        return (math.cos(radians), -math.sin(radians))
 
     def getPovX(self) -> float:
         """
@@ -371,7 +405,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The X-axis value of the POV.
         """
-        return self.__pov_xy()[0]
+        return self.getPovXY()[0]
 
     def getPovY(self) -> float:
         """
@@ -389,7 +423,7 @@ class LemonInput(GenericHID):
         Returns:
             float: The Y-axis value of the POV.
         """
-        return self.__pov_xy()[1]
+        return self.getPovXY()[1]
 
     def initSendable(self, builder):
         """
@@ -399,38 +433,22 @@ class LemonInput(GenericHID):
             builder: The sendable builder.
         """
         builder.setSmartDashboardType("LemonInput")
-        builder.addStringProperty("Type", lambda: self.contype, lambda: None)
-        builder.addBooleanProperty(
-            "LeftBumper", lambda: self.getLeftBumper(), lambda: None
-        )
-        builder.addBooleanProperty(
-            "RightBumper", lambda: self.getRightBumper(), lambda: None
-        )
-        builder.addBooleanProperty(
-            "StartButton", lambda: self.getStartButton(), lambda: None
-        )
-        builder.addBooleanProperty(
-            "BackButton", lambda: self.getBackButton(), lambda: None
-        )
-        builder.addBooleanProperty("AButton", lambda: self.getAButton(), lambda: None)
-        builder.addBooleanProperty("BButton", lambda: self.getBButton(), lambda: None)
-        builder.addBooleanProperty("XButton", lambda: self.getXButton(), lambda: None)
-        builder.addBooleanProperty("YButton", lambda: self.getYButton(), lambda: None)
-        builder.addBooleanProperty(
-            "LStickButton", lambda: self.getLeftStickButton(), lambda: None
-        )
-        builder.addBooleanProperty(
-            "RStickButton", lambda: self.getRightStickButton(), lambda: None
-        )
-        builder.addDoubleProperty("LeftX", lambda: self.getLeftX(), lambda: None)
-        builder.addDoubleProperty("LeftY", lambda: self.getLeftY(), lambda: None)
-        builder.addDoubleProperty("RightX", lambda: self.getRightX(), lambda: None)
-        builder.addDoubleProperty("RightY", lambda: self.getRightY(), lambda: None)
-        builder.addDoubleProperty(
-            "RightTrigger", lambda: self.getRightTriggerAxis(), lambda: None
-        )
-        builder.addDoubleProperty(
-            "LeftTrigger", lambda: self.getLeftTriggerAxis(), lambda: None
-        )
-        builder.addDoubleProperty("POV_X", lambda: self.getPovX(), lambda: None)
-        builder.addDoubleProperty("POV_Y", lambda: self.getPovY(), lambda: None)
+        builder.addStringProperty("Type", self.getType, _noop)
+        builder.addBooleanProperty("LeftBumper", self.getLeftBumper, _noop)
+        builder.addBooleanProperty("RightBumper", self.getRightBumper, _noop)
+        builder.addBooleanProperty("StartButton", self.getStartButton, _noop)
+        builder.addBooleanProperty("BackButton", self.getBackButton, _noop)
+        builder.addBooleanProperty("AButton", self.getAButton, _noop)
+        builder.addBooleanProperty("BButton", self.getBButton, _noop)
+        builder.addBooleanProperty("XButton", self.getXButton, _noop)
+        builder.addBooleanProperty("YButton", self.getYButton, _noop)
+        builder.addBooleanProperty("LStickButton", self.getLeftStickButton, _noop)
+        builder.addBooleanProperty("RStickButton", self.getRightStickButton, _noop)
+        builder.addDoubleProperty("LeftX", self.getLeftX, _noop)
+        builder.addDoubleProperty("LeftY", self.getLeftY, _noop)
+        builder.addDoubleProperty("RightX", self.getRightX, _noop)
+        builder.addDoubleProperty("RightY", self.getRightY, _noop)
+        builder.addDoubleProperty("RightTrigger", self.getRightTriggerAxis, _noop)
+        builder.addDoubleProperty("LeftTrigger", self.getLeftTriggerAxis, _noop)
+        builder.addDoubleProperty("POV_X", self.getPovX, _noop)
+        builder.addDoubleProperty("POV_Y", self.getPovY, _noop)
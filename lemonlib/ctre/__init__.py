@@ -1,3 +1,4 @@
+import time
 from typing import Callable
 
 from phoenix6.status_code import StatusCode
@@ -8,8 +9,15 @@ from .talonfx import LemonTalonFX
 __all__ = ["LemonPigeon", "LemonTalonFX"]
 
 
-def tryUntilOk(attempts: int, command: Callable[[], StatusCode]):
-    for _ in range(attempts):
+def tryUntilOk(attempts: int, command: Callable[[], StatusCode]) -> StatusCode:
+    """Runs command until it returns an OK status or attempts run out,
+    backing off between retries so a failing device doesn't flood the CAN bus.
+    Returns the last status code."""
+    code = None
+    for attempt in range(attempts):
         code = command()
         if code.is_ok():
             break
+        if attempt < attempts - 1:
+            time.sleep(0.001 * (1 << min(attempt, 6)))
+    return code
@@ -1,6 +1,10 @@
 import math
 
+from phoenix6 import BaseStatusSignal
 from phoenix6.hardware.pigeon2 import Pigeon2
+from wpimath.geometry import Rotation2d, Rotation3d
+
+_DEG2RAD = math.pi / 180.0
 
 
 class LemonPigeon:
@@ -9,25 +13,39 @@ class LemonPigeon:
     def __init__(self, can_id: int):
         self.gyro = Pigeon2(can_id)
         self.gyro.reset()
+        # Status signals are reusable handles; look them up once and refresh
+        self._yaw = self.gyro.get_yaw()
+        self._pitch = self.gyro.get_pitch()
+        self._roll = self.gyro.get_roll()
+        self._yaw_rate = self.gyro.get_angular_velocity_z_world()
 
     def getAngleCCW(self):
 
-        return self.gyro.get_yaw().value
+        return self._yaw.refresh().value
 
     def getRoll(self):
-        return self.gyro.get_roll().value
+        return self._roll.refresh().value
 
     def getPitch(self):
-        return self.gyro.get_pitch().value
+        return self._pitch.refresh().value
 
     def getDegreesPerSecCCW(self):
-        return self.gyro.get_angular_velocity_z_world().value
+        return self._yaw_rate.refresh().value
 
     def getRadiansPerSecCCW(self):
-        return math.radians(self.getDegreesPerSecCCW())
+        return self.getDegreesPerSecCCW() * _DEG2RAD
 
     def getRotation2d(self):
-        return self.gyro.getRotation2d()
+        return Rotation2d(self._yaw.refresh().value * _DEG2RAD)
+
+    def getRotation3d(self):
+        """Returns the orientation from yaw, pitch and roll, refreshed together."""
+        BaseStatusSignal.refresh_all(self._yaw, self._pitch, self._roll)
+        return Rotation3d(
+            self._roll.value * _DEG2RAD,
+            self._pitch.value * _DEG2RAD,
+            self._yaw.value * _DEG2RAD,
+        )
 
     def setAngleAdjustment(self, angle):
         self.gyro.set_yaw(angle)
@@ -16,6 +16,11 @@ class LemonTalonFX(phoenix6.hardware.TalonFX, MotorController):
         self.duty_cycle_out = phoenix6.controls.DutyCycleOut(0, enable_foc=enable_foc)
         self.voltage_out = phoenix6.controls.VoltageOut(0, enable_foc=enable_foc)
         self.is_disabled = False
+        # Not applied yet: the first setter call must always reach the device
+        self._config_applied = False
+        self._config_dirty = False
+        # Phoenix keeps sending the last request, so identical ones are skipped
+        self._last_request = None
 
     def disable(self):
         self.stopMotor()
@@ -30,35 +35,80 @@ class LemonTalonFX(phoenix6.hardware.TalonFX, MotorController):
             == phoenix6.signals.InvertedValue.COUNTER_CLOCKWISE_POSITIVE
         )
 
+    def flush_config(self):
+        """Apply any pending configuration changes in a single write."""
+        if self._config_dirty:
+            self._config_dirty = False
+            self._config_applied = True
+            self.configurator.apply(self.config)
+
     def set(self, speed: float):
         if not self.is_disabled:
-            self.duty_cycle_out.output = speed
-            self.set_control(self.duty_cycle_out)
+            if self._config_dirty:
+                self.flush_config()
+            request = self.duty_cycle_out
+            if self._last_request is request and request.output == speed:
+                return
+            request.output = speed
+            self.set_control(request)
+            self._last_request = request
 
-    def setIdleMode(self, mode: phoenix6.signals.NeutralModeValue):
+    def setIdleMode(self, mode: phoenix6.signals.NeutralModeValue, apply: bool = True):
         """Set the idle mode setting
 
         Arguments:
         mode -- Idle mode (coast or brake)
+        apply -- If true, `self.config` (including any other edits made to it)
+            is applied now. If false, the change is held until
+            `flush_config()` or the next output is set, so several changes
+            cost a single apply
         """
-        self.config.motor_output.neutral_mode = mode
-        self.configurator.apply(self.config)
+        motor_output = self.config.motor_output
+        if apply or motor_output.neutral_mode != mode or not self._config_applied:
+            motor_output.neutral_mode = mode
+            self._config_dirty = True
+        if apply:
+            self.flush_config()
+
+    def setInverted(self, isInverted: bool, apply: bool = True):
+        """Set the inversion setting
 
-    def setInverted(self, isInverted: bool):
+        Arguments:
+        isInverted -- If true, clockwise is positive
+        apply -- Same as in `setIdleMode()`
+        """
         if isInverted:
-            self.config.motor_output.inverted = (
-                phoenix6.signals.InvertedValue.CLOCKWISE_POSITIVE
-            )
+            inverted = phoenix6.signals.InvertedValue.CLOCKWISE_POSITIVE
         else:
-            self.config.motor_output.inverted = (
-                phoenix6.signals.InvertedValue.COUNTER_CLOCKWISE_POSITIVE
-            )
-        self.configurator.apply(self.config)
+            inverted = phoenix6.signals.InvertedValue.COUNTER_CLOCKWISE_POSITIVE
+        motor_output = self.config.motor_output
+        if apply or motor_output.inverted != inverted or not self._config_applied:
+            motor_output.inverted = inverted
+            self._config_dirty = True
+        if apply:
+            self.flush_config()
 
     def setVoltage(self, volts: float):
         if not self.is_disabled:
-            self.voltage_out.output = volts
-            self.set_control(self.voltage_out)
+            if self._config_dirty:
+                self.flush_config()
+            request = self.voltage_out
+            if self._last_request is request and request.output == volts:
+                return
+            request.output = volts
+            self.set_control(request)
+            self._last_request = request
+
+    def set_control(self, request):
+        # Any request sent here replaces the one set()/setVoltage() last
+        # sent, so their next call must not be skipped as a duplicate
+        self._last_request = None
+        return phoenix6.hardware.TalonFX.set_control(self, request)
+
+    def resend_control(self):
+        """Makes the next `set()` or `setVoltage()` send its request even if
+        the value has not changed."""
+        self._last_request = None
 
     def stopMotor(self):
         self.set(0)
@@ -1,4 +1,5 @@
 from .killoughdrive import KilloughDrive
 from .swagdrive import SwagDrive
+from .vector2d import Vector2d
 
 __all__ = ["Vector2d", "SwagDrive", "KilloughDrive"]
@@ -6,6 +6,8 @@ from wpiutil import SendableBuilder
 
 __all__ = ["KilloughDrive"]
 
+_SQRT2 = math.sqrt(2)
+
 
 class KilloughDrive:
     r"""A class for driving Killough (Kiwi) drive platforms.
@@ -31,6 +33,20 @@ class KilloughDrive:
     positive.
     """
 
+    __slots__ = (
+        "front_right_motor",
+        "front_left_motor",
+        "back_motor",
+        "angles",
+        "transform",
+        "_transform_rows",
+        "_fused_angle",
+        "_fused_rows",
+        "x",
+        "y",
+        "theta",
+    )
+
     def __init__(
         self,
         front_right_motor: MotorController,
@@ -61,6 +77,10 @@ class KilloughDrive:
         for angle in self.angles:
             rad = math.radians(angle)
             self.transform.append([math.cos(rad), math.sin(rad), 1])
+        # immutable copy (and its gyro-rotated form) read every loop
+        self._transform_rows = tuple(tuple(row) for row in self.transform)
+        self._fused_angle = 0.0
+        self._fused_rows = self._transform_rows
 
     def drive_cartesian(
         self, ySpeed: float, xSpeed: float, omega: float, gyro_angle: float = 0.0
@@ -76,8 +96,7 @@ class KilloughDrive:
         :param gyro_angle: The current angle reading from the gyro in degrees around the Z axis.
                            Use this to implement field-oriented controls.
         """
-        x, y = self._apply_field_oriented_control(xSpeed, ySpeed, gyro_angle)
-        speeds = self._calculate_wheel_speeds(x, y, omega)
+        speeds = self._calculate_wheel_speeds(xSpeed, ySpeed, omega, gyro_angle)
 
         self.front_left_motor.set(speeds[0])
         self.front_right_motor.set(speeds[1])
@@ -93,21 +112,29 @@ class KilloughDrive:
         :param angle: The angle around the Z axis at which the robot drives in degrees [-180..180].
         :param zRotation: The robot's rotation rate around the Z axis [-1.0..1.0]. Clockwise is positive.
         """
-        magnitude = max(min(magnitude, 1), -1) * math.sqrt(2)
+        magnitude = max(min(magnitude, 1), -1) * _SQRT2
+        angle = math.radians(angle)
 
         self.drive_cartesian(
-            magnitude * math.cos(math.radians(angle)),
-            magnitude * math.sin(math.radians(angle)),
+            magnitude * math.cos(angle),
+            magnitude * math.sin(angle),
             zRotation,
             0,
         )
 
-    def _apply_field_oriented_control(self, vx: float, vy: float, gyro_angle: float):
-        """Applies field-oriented correction using the gyro."""
-        robot_angle = math.radians(gyro_angle)
-        temp_vx = vx * math.cos(robot_angle) - vy * math.sin(robot_angle)
-        vy = vx * math.sin(robot_angle) + vy * math.cos(robot_angle)
-        return temp_vx, vy
+    def _field_oriented_rows(self, gyro_angle: float):
+        """Returns the wheel transform with the field-oriented gyro rotation
+        folded in, recomputing it only when the gyro angle changes."""
+        if gyro_angle != self._fused_angle:
+            robot_angle = math.radians(gyro_angle)
+            cos = math.cos(robot_angle)
+            sin = math.sin(robot_angle)
+            self._fused_rows = tuple(
+                (a * cos + b * sin, b * cos - a * sin, c)
+                for a, b, c in self._transform_rows
+            )
+            self._fused_angle = gyro_angle
+        return self._fused_rows
 
     def normalize(self, v1: float, v2: float, v3: float):
         """Normalizes wheel speeds to keep them within [-1.0..1.0]."""
@@ -118,31 +145,26 @@ class KilloughDrive:
             v3 /= max_speed
         return [v1, v2, v3]
 
-    def _calculate_wheel_speeds(self, vx: float, vy: float, omega: float):
-        """Computes the wheel speeds and applies normalization."""
-        v1 = (
-            self.transform[0][0] * vx
-            + self.transform[0][1] * vy
-            + self.transform[0][2] * omega
-        )
-        v2 = (
-            self.transform[1][0] * vx
-            + self.transform[1][1] * vy
-            + self.transform[1][2] * omega
-        )
-        v3 = (
-            self.transform[2][0] * vx
-            + self.transform[2][1] * vy
-            + self.transform[2][2] * omega
+    def _calculate_wheel_speeds(
+        self, vx: float, vy: float, omega: float, gyro_angle: float = 0.0
+    ):
+        """Computes the (optionally field-oriented) wheel speeds and applies
+        normalization."""
+        rows = self._field_oriented_rows(gyro_angle)
+        (a1, b1, c1), (a2, b2, c2), (a3, b3, c3) = rows
+        return self.normalize(
+            a1 * vx + b1 * vy + c1 * omega,
+            a2 * vx + b2 * vy + c2 * omega,
+            a3 * vx + b3 * vy + c3 * omega,
         )
 
-        return self.normalize(v1, v2, v3)
-
     def _update_odometry(self, vx: float, vy: float, omega: float, dt: float):
         """Updates the robot's estimated position on the field."""
-        self.theta += omega * dt
-        self.x += (vx * math.cos(self.theta) - vy * math.sin(self.theta)) * dt
-        self.y += (vx * math.sin(self.theta) + vy * math.cos(self.theta)) * dt
+        self.theta = theta = self.theta + omega * dt
+        cos = math.cos(theta)
+        sin = math.sin(theta)
+        self.x += (vx * cos - vy * sin) * dt
+        self.y += (vx * sin + vy * cos) * dt
 
     def get_position(self):
         """Returns the estimated position of the robot."""
@@ -1,3 +1,4 @@
+from wpilib import Timer
 from wpilib.drive import DifferentialDrive
 from wpiutil import Sendable
 
@@ -12,6 +13,9 @@ class SwagDrive(Sendable):
     minswag = SmartPreference(0.1)
     swagmulti = SmartPreference(10)
 
+    # seconds between re-reading the swag preferences
+    prefs_period = 0.5
+
     def __init__(self, leftMotor, rightMotor):
         Sendable.__init__(self)
         self.leftMotor = leftMotor
@@ -23,23 +27,35 @@ class SwagDrive(Sendable):
         self.swagPeriod = 0
         self.oldMove = 0
         self.oldRotate = 0
+        self._prefs_read_at = float("-inf")
+
+    def _refresh_prefs(self):
+        """Reads the swag preferences into plain attributes."""
+        self._swag_barrier = self.minswag
+        self._swag_multiplier = self.swagmulti
+        self._max_swag_level = self.maxswag
+        self._swag_add = self.swagadd
 
     def Drive(self, moveValue, rotateValue):
         """Custom drive function that incorporates 'swag' logic."""
 
-        SWAG_BARRIER = self.minswag
-        SWAG_MULTIPLIER = self.swagmulti
-        MAX_SWAG_LEVEL = self.maxswag
+        now = Timer.getFPGATimestamp()
+        if now - self._prefs_read_at > self.prefs_period:
+            self._refresh_prefs()
+            self._prefs_read_at = now
+
+        SWAG_BARRIER = self._swag_barrier
+        SWAG_MULTIPLIER = self._swag_multiplier
+        MAX_SWAG_LEVEL = self._max_swag_level
         SWAG_PERIOD = 500
-        SWAG_ADD = self.swagadd
+        SWAG_ADD = self._swag_add
 
         moveToSend = moveValue
         rotateToSend = rotateValue
+        moveDiff = abs(moveValue - self.oldMove)
+        rotateDiff = abs(rotateValue - self.oldRotate)
 
         if self.swagPeriod == 0:
-            moveDiff = abs(moveValue - self.oldMove)
-            rotateDiff = abs(rotateValue - self.oldRotate)
-
             if moveDiff < SWAG_BARRIER:
                 moveToSend = (moveDiff * SWAG_MULTIPLIER) + moveValue
             else:
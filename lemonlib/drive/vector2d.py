@@ -1,16 +1,20 @@
-import math
+from math import cos, hypot, radians, sin
 
 
 class Vector2d:
+    __slots__ = ("x", "y")
+
     def __init__(self, x=0.0, y=0.0):
         self.x = x  # forward component
         self.y = y  # right component
 
     def rotate(self, angle_deg):
         """Rotate this vector counter-clockwise by angle_deg degrees."""
-        angle_rad = math.radians(angle_deg)
-        cosA = math.cos(angle_rad)
-        sinA = math.sin(angle_rad)
+        if angle_deg == 0:
+            return
+        angle_rad = radians(angle_deg)
+        cosA = cos(angle_rad)
+        sinA = sin(angle_rad)
         x_new = self.x * cosA - self.y * sinA
         y_new = self.x * sinA + self.y * cosA
         self.x = x_new
@@ -20,11 +24,11 @@ class Vector2d:
         return self.x * other.x + self.y * other.y
 
     def magnitude(self):
-        return math.hypot(self.x, self.y)
+        return hypot(self.x, self.y)
 
     def scalarProject(self, other):
         """Returns the scalar projection of this vector onto 'other'."""
-        mag = other.magnitude()
+        mag = hypot(other.x, other.y)
         if mag == 0:
             return 0.0
-        return self.dot(other) / mag
+        return (self.x * other.x + self.y * other.y) / mag
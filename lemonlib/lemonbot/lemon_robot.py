@@ -1,7 +1,9 @@
-from typing import Callable, Dict, List
+import heapq
+import itertools
+from typing import Callable, Dict, List, Tuple
 
 import magicbot
-from wpilib import DriverStation, Timer
+from wpilib import DriverStation, RobotController
 
 from lemonlib.smart import SmartNT, SmartPreference
 
@@ -24,11 +26,15 @@ class LemonRobot(magicbot.MagicRobot):
     def __init__(self):
         super().__init__()
 
-        self._periodic_callbacks: List[List] = []
+        # (deadline, order, callback, period) in FPGA microseconds,
+        # soonest deadline first
+        self._periodic_heap: List[Tuple[int, int, Callable[[], None], int]] = []
+        self._periodic_order = itertools.count()
 
         self.loop_time = self.control_loop_wait_time
         self._last_watchdog_profile_time = 0.0
         self._overrun_count = 0
+        self._watchdog_profiling = False
 
         # Profiling storage
         self._last_overrun_epochs: Dict[str, float] = {}
@@ -39,18 +45,46 @@ class LemonRobot(magicbot.MagicRobot):
         self._smart_nt = SmartNT("LemonRobot")
 
     def add_periodic(self, callback: Callable[[], None], period: float):
-        now = Timer.getFPGATimestamp()
-        self._periodic_callbacks.append([callback, period, now])
+        """Calls callback every period seconds while the robot is enabled."""
+        period_us = int(period * 1e6)
+        if period_us <= 0:
+            raise ValueError(f"period must be at least 1us (not {period})")
+        deadline = RobotController.getFPGATime() + period_us
+        heapq.heappush(
+            self._periodic_heap,
+            (deadline, next(self._periodic_order), callback, period_us),
+        )
 
     def _run_periodics(self):
-        now = Timer.getFPGATimestamp()
-        for entry in self._periodic_callbacks:
-            callback, period, last = entry
-            if now - last >= period:
-                entry[2] = now
+        heap = self._periodic_heap
+        if not heap:
+            return
+        now = RobotController.getFPGATime()
+        while heap[0][0] <= now:
+            deadline, order, callback, period_us = heap[0]
+            # step from the deadline, not from now, so loop jitter does not
+            # push the schedule later; overruns skip the missed periods
+            missed = (now - deadline) // period_us
+            heapq.heapreplace(
+                heap,
+                (deadline + period_us * (1 + missed), order, callback, period_us),
+            )
+            try:
                 callback()
+            except Exception:
+                self.onException()
 
     def autonomousPeriodic(self):
+        """
+        Periodic code for autonomous mode should go here.
+        Runs when not enabled for trajectory display.
+
+        Users should override this method for code which will be called
+        periodically at a regular rate while the robot is in autonomous mode.
+
+        This code executes before the ``execute`` functions of all
+        components are called.
+        """
         pass
 
     def autonomous(self):
@@ -58,10 +92,18 @@ class LemonRobot(magicbot.MagicRobot):
         self.autonomousPeriodic()
 
     def enabledperiodic(self) -> None:
+        """Periodic code for when the bot is enabled should go here.
+        Runs when not enabled for trajectory display.
+
+        Users should override this method for code which will be called"""
         pass
 
     def _on_mode_enable_components(self):
         super()._on_mode_enable_components()
+        # decided once per enable; never profile on the field
+        self._watchdog_profiling = (
+            self.watchdog_profile and not DriverStation.isFMSAttached()
+        )
         self.on_enable()
 
     def on_enable(self):
@@ -84,30 +126,37 @@ class LemonRobot(magicbot.MagicRobot):
         super().robotPeriodic()
 
     def _enabled_periodic(self) -> None:
-        watchdog = self.watchdog
+        add_epoch = self.watchdog.addEpoch
+        on_exception = self.onException
 
         for name, component in self._components:
             try:
                 component.execute()
             except Exception:
-                self.onException()
-            watchdog.addEpoch(name)
+                on_exception()
+            add_epoch(name)
 
         self.enabledperiodic()
-        watchdog.addEpoch("enabledperiodic")
+        add_epoch("enabledperiodic")
 
+        self._run_periodics()
         self._do_periodics()
-        watchdog.addEpoch("periodics")
+        add_epoch("periodics")
+
+        for reset_dict, component in self._reset_components:
+            component.__dict__.update(reset_dict)
 
     def _do_periodics(self):
         super()._do_periodics()
 
-        if not self.watchdog_profile:
+        if not self._watchdog_profiling:
             self.loop_time = max(self.control_loop_wait_time, self.watchdog.getTime())
             return
 
         wd = self.watchdog
-        loop_time = wd.getTime()
+        # one FPGA read serves the loop time, profile rate limit and total
+        now = wd._get_time()
+        loop_time = (now - wd._startTime) * 1e-6
         is_overrun = loop_time > self.control_loop_wait_time
 
         epochs = wd._epochs
@@ -120,8 +169,10 @@ class LemonRobot(magicbot.MagicRobot):
         ema_overrun = self._epoch_ema_overrun
         last_overrun = self._last_overrun_epochs
 
+        # one pass computes each epoch's delta and feeds every average
         for key, value in epochs:
             delta = (value - prev) * 1e-6
+            prev = value
 
             prev_ema = ema_all.get(key)
             if prev_ema is None:
@@ -129,14 +180,7 @@ class LemonRobot(magicbot.MagicRobot):
             else:
                 ema_all[key] = alpha * delta + one_minus_alpha * prev_ema
 
-            prev = value
-
-        if is_overrun:
-            self._overrun_count += 1
-
-            prev = wd._startTime
-            for key, value in epochs:
-                delta = (value - prev) * 1e-6
+            if is_overrun:
                 last_overrun[key] = delta
 
                 prev_ema = ema_overrun.get(key)
@@ -145,75 +189,42 @@ class LemonRobot(magicbot.MagicRobot):
                 else:
                     ema_overrun[key] = alpha * delta + one_minus_alpha * prev_ema
 
-                prev = value
-
-        now_fpga = Timer.getFPGATimestamp()
-        if now_fpga - self._last_watchdog_profile_time >= self.watchdog_profile_period:
-            self._last_watchdog_profile_time = now_fpga
+        if is_overrun:
+            self._overrun_count += 1
 
-            start = wd._startTime
-            now = wd._get_time()
-            total_time = (now - start) * 1e-6
+        now_s = now * 1e-6
+        if now_s - self._last_watchdog_profile_time >= self.watchdog_profile_period:
+            self._last_watchdog_profile_time = now_s
 
-            self._smart_nt.put_number("Watchdog/LoopTime", round(loop_time, 6))
-            self._smart_nt.put_number(
-                "Watchdog/ControlPeriod", round(self.control_loop_wait_time, 6)
-            )
+            put_number = self._smart_nt.put_number
+            put_number("Watchdog/LoopTime", round(loop_time, 6))
+            put_number("Watchdog/ControlPeriod", round(self.control_loop_wait_time, 6))
             self._smart_nt.put_boolean("Watchdog/Overrun", is_overrun)
-            self._smart_nt.put_number("Watchdog/OverrunCount", self._overrun_count)
-            self._smart_nt.put_number("Watchdog Epochs/Total", round(total_time, 6))
-
-            if last_overrun:
-                max_last = 0.0
-                total_last = 0.0
-                for v in last_overrun.values():
-                    total_last += v
-                    if v > max_last:
-                        max_last = v
-
-                self._smart_nt.put_number(
-                    "Watchdog LastOverrun/Max", round(max_last, 6)
-                )
-                self._smart_nt.put_number(
-                    "Watchdog LastOverrun/Total", round(total_last, 6)
-                )
-
-                for k, v in last_overrun.items():
-                    self._smart_nt.put_number(f"Watchdog LastOverrun/{k}", round(v, 6))
-
-            if ema_all:
-                max_all = 0.0
-                total_all = 0.0
-                for v in ema_all.values():
-                    total_all += v
-                    if v > max_all:
-                        max_all = v
-
-                self._smart_nt.put_number("Watchdog EMA/Max", round(max_all, 6))
-                self._smart_nt.put_number("Watchdog EMA/Total", round(total_all, 6))
-
-                for k, v in ema_all.items():
-                    self._smart_nt.put_number(f"Watchdog EMA/{k}", round(v, 6))
-
-            if ema_overrun:
-                max_or = 0.0
-                total_or = 0.0
-                for v in ema_overrun.values():
-                    total_or += v
-                    if v > max_or:
-                        max_or = v
-
-                self._smart_nt.put_number("Watchdog EMAOverrun/Max", round(max_or, 6))
-                self._smart_nt.put_number(
-                    "Watchdog EMAOverrun/Total", round(total_or, 6)
-                )
-
-                for k, v in ema_overrun.items():
-                    self._smart_nt.put_number(f"Watchdog EMAOverrun/{k}", round(v, 6))
+            put_number("Watchdog/OverrunCount", self._overrun_count)
+            put_number("Watchdog Epochs/Total", round(loop_time, 6))
+
+            self._publish_epoch_times("Watchdog LastOverrun", last_overrun)
+            self._publish_epoch_times("Watchdog EMA", ema_all)
+            self._publish_epoch_times("Watchdog EMAOverrun", ema_overrun)
 
         wd.addEpoch("watchdog_profile")
         self.loop_time = max(self.control_loop_wait_time, loop_time)
 
+    def _publish_epoch_times(self, prefix: str, times: Dict[str, float]) -> None:
+        """Publishes the max, total and per-epoch times under prefix."""
+        if not times:
+            return
+        put_number = self._smart_nt.put_number
+        max_time = 0.0
+        total_time = 0.0
+        for k, v in times.items():
+            total_time += v
+            if v > max_time:
+                max_time = v
+            put_number(f"{prefix}/{k}", round(v, 6))
+        put_number(f"{prefix}/Max", round(max_time, 6))
+        put_number(f"{prefix}/Total", round(total_time, 6))
+
     def get_period(self) -> float:
         """Get the period of the robot loop in seconds."""
         return self.loop_time
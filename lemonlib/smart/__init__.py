@@ -1,6 +1,34 @@
+import importlib
+
 from .controller import SmartController
 from .nettables import SmartNT
 from .preference import SmartPreference
 from .profile import SmartProfile
 
-__all__ = ["SmartController", "SmartPreference", "SmartProfile", "SmartNT"]
+# NumpyPIDBank is imported on first access (PEP 562) so that the rest of
+# lemonlib.smart does not require numpy.
+_LAZY = {
+    "NumpyPIDBank": ".pidbank",
+}
+
+__all__ = [
+    "NumpyPIDBank",
+    "SmartController",
+    "SmartPreference",
+    "SmartProfile",
+    "SmartNT",
+]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,5 @@
+from wpilib import RobotController
+
 from .nettables import SmartNT
 
 
@@ -5,24 +7,87 @@ class SmartController:
     """Used as a general wrapper for a variety of controllers that may
     optionally report values to NetworkTables. It is recommended to
     create these using a `SmartProfile`.
+
+    Setting `SmartController.low_bandwidth = True` disables feedback for
+    every controller, regardless of `feedback_enabled`.
     """
 
-    def __init__(self, key: str, calculate_method, feedback_enabled):
+    __slots__ = (
+        "_calculate_method",
+        "reference",
+        "measurement",
+        "error",
+        "output",
+        "tolerance",
+        "_publish_period",
+        "_last_publish",
+        "_nt",
+        "_entries",
+        "_assume_pure",
+        "_cached",
+    )
+
+    low_bandwidth = False
+
+    # NT wrappers shared by every controller created with the same key,
+    # so re-creating controllers on enable does not keep re-registering
+    _tables: dict[str, SmartNT] = {}
+
+    def __init__(
+        self,
+        key: str,
+        calculate_method,
+        feedback_enabled,
+        publish_period: float = 0.05,
+        assume_pure: bool = False,
+    ):
+        """
+        :param publish_period: Minimum time (seconds) between NetworkTables
+            publishes. Values from `calculate()` calls in between are staged
+            and only the latest ones are sent.
+        :param assume_pure: Set if `calculate_method` has no internal state
+            (eg. a feedforward), so a `calculate()` call with the same
+            measurement and reference as the last one reuses its output.
+        """
         self._calculate_method = calculate_method
+        self._assume_pure = assume_pure
+        self._cached = False
         self.reference = 0
         self.measurement = 0
         self.error = 0
         self.output = 0
         self.tolerance = 0.0
-        if feedback_enabled:
-            self._nt = SmartNT(f"SmartController/{key}_controller")
-            self._nt.set_type("SmartController")
+        self._publish_period = int(publish_period * 1e6)  # microseconds
+        self._last_publish = 0
+        if feedback_enabled and not SmartController.low_bandwidth:
+            nt = SmartController._get_table(key)
+            self._nt = nt
+            # resolved once so flush() is four direct setDouble calls
+            self._entries = (
+                nt._get_entry("Reference"),
+                nt._get_entry("Measurement"),
+                nt._get_entry("Error"),
+                nt._get_entry("Output"),
+            )
         else:
             self._nt = None
+            self._entries = None
+
+    @staticmethod
+    def _get_table(key: str) -> SmartNT:
+        try:
+            return SmartController._tables[key]
+        except KeyError:
+            pass
+        nt = SmartNT(f"SmartController/{key}_controller")
+        nt.set_type("SmartController")
+        SmartController._tables[key] = nt
+        return nt
 
     def setTolerance(self, error_tolerance: float):
         """Sets the error tolerance for the controller."""
         self.tolerance = error_tolerance
+        self._cached = False
 
     def at_setpoint(self) -> bool:
         """Checks if the controller is at the setpoint within the tolerance."""
@@ -45,17 +110,33 @@ class SmartController:
         return self.measurement
 
     def calculate(self, measurement: float, reference: float):
-        self.reference = reference
-        self.measurement = measurement
-        self.error = reference - measurement
-        if abs(self.error) < self.tolerance:
-            self.output = 0.0
-        else:
-            self.output = self._calculate_method(measurement, reference)
-        nt = self._nt
-        if nt is not None:
-            nt.put_number("Reference", reference)
-            nt.put_number("Measurement", measurement)
-            nt.put_number("Error", self.error)
-            nt.put_number("Output", self.output)
+        if not (
+            self._cached
+            and measurement == self.measurement
+            and reference == self.reference
+        ):
+            self.reference = reference
+            self.measurement = measurement
+            self.error = reference - measurement
+            if abs(self.error) < self.tolerance:
+                self.output = 0.0
+            else:
+                self.output = self._calculate_method(measurement, reference)
+            self._cached = self._assume_pure
+        if self._nt is not None:
+            now = RobotController.getFPGATime()
+            if now - self._last_publish >= self._publish_period:
+                self._last_publish = now
+                self.flush()
         return self.output
+
+    def flush(self):
+        """Publishes the latest staged values to NetworkTables immediately."""
+        entries = self._entries
+        if entries is None:
+            return
+        reference, measurement, error, output = entries
+        reference.setDouble(self.reference)
+        measurement.setDouble(self.measurement)
+        error.setDouble(self.error)
+        output.setDouble(self.output)
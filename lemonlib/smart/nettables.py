@@ -1,6 +1,21 @@
 from typing import Any, Dict, List
 
-from ntcore import NetworkTableEntry, NetworkTableInstance
+from ntcore import NetworkTable, NetworkTableEntry, NetworkTableInstance
+
+# exact-type dispatch for the generic put/get; bool is its own key, so
+# True/False never fall through to the double setter
+_PUTTERS = {
+    bool: NetworkTableEntry.setBoolean,
+    float: NetworkTableEntry.setDouble,
+    int: NetworkTableEntry.setDouble,
+    str: NetworkTableEntry.setString,
+}
+_GETTERS = {
+    bool: NetworkTableEntry.getBoolean,
+    float: NetworkTableEntry.getDouble,
+    int: NetworkTableEntry.getDouble,
+    str: NetworkTableEntry.getString,
+}
 
 
 class SmartNT:
@@ -10,12 +25,13 @@ class SmartNT:
     a single dict lookup — no string splitting, no sub-table traversal.
     """
 
-    __slots__ = ("table", "_entries", "_nt", "_sa_pubs")
+    __slots__ = ("table", "_entries", "_subtables", "_nt", "_sa_pubs")
 
     def __init__(self, root_table: str = "/"):
         self._nt = NetworkTableInstance.getDefault()
         self.table = self._nt.getTable(root_table.strip("/"))
         self._entries: Dict[str, NetworkTableEntry] = {}
+        self._subtables: Dict[str, NetworkTable] = {}
         self._sa_pubs: Dict[str, Any] = {}  # StringArray publishers
 
     def _get_entry(self, key: str) -> NetworkTableEntry:
@@ -23,14 +39,25 @@ class SmartNT:
             return self._entries[key]
         except KeyError:
             pass
-        path_parts = key.strip("/").split("/")
-        table = self.table
-        for part in path_parts[:-1]:
-            table = table.getSubTable(part)
-        entry = table.getEntry(path_parts[-1])
+        path, _, name = key.strip("/").rpartition("/")
+        table = self._get_subtable(path) if path else self.table
+        entry = table.getEntry(name)
         self._entries[key] = entry
         return entry
 
+    def _get_subtable(self, path: str) -> NetworkTable:
+        # sibling keys (eg. every epoch under "Watchdog EMA/") share one
+        # cached sub-table instead of each walking the path again
+        try:
+            return self._subtables[path]
+        except KeyError:
+            pass
+        parent_path, _, name = path.rpartition("/")
+        parent = self._get_subtable(parent_path) if parent_path else self.table
+        table = parent.getSubTable(name)
+        self._subtables[path] = table
+        return table
+
     def set_type(self, type_name: str) -> None:
         """Set the `.type` metadata entry so dashboards render the correct widget."""
         self.table.getEntry(".type").setString(type_name)
@@ -46,6 +73,9 @@ class SmartNT:
     def put_string(self, key: str, value: str) -> None:
         self._get_entry(key).setString(value)
 
+    def put_number_array(self, key: str, value: List[float]) -> None:
+        self._get_entry(key).setDoubleArray(value)
+
     def put_string_array(self, key: str, value: List[str]) -> None:
         try:
             pub = self._sa_pubs[key]
@@ -69,25 +99,30 @@ class SmartNT:
     # ── generic put/get (kept for backwards compat) ──
 
     def put(self, key: str, value: Any) -> None:
-        entry = self._get_entry(key)
-        if isinstance(value, bool):
-            entry.setBoolean(value)
-        elif isinstance(value, (float, int)):
-            entry.setDouble(float(value))
-        elif isinstance(value, str):
-            entry.setString(value)
-        else:
-            raise TypeError(f"Unsupported value type for key '{key}': {type(value)}")
+        setter = _PUTTERS.get(type(value))
+        if setter is None:
+            setter = self._resolve(_PUTTERS, value)
+            if setter is None:
+                raise TypeError(
+                    f"Unsupported value type for key '{key}': {type(value)}"
+                )
+        setter(self._get_entry(key), value)
 
     def get(self, key: str, default: Any = None) -> Any:
-        entry = self._get_entry(key)
-        if isinstance(default, bool):
-            return entry.getBoolean(default)
-        elif isinstance(default, (float, int)):
-            return entry.getDouble(default)
-        elif isinstance(default, str):
-            return entry.getString(default)
-        else:
-            raise TypeError(
-                f"Unsupported default type for key '{key}': {type(default)}"
-            )
+        getter = _GETTERS.get(type(default))
+        if getter is None:
+            getter = self._resolve(_GETTERS, default)
+            if getter is None:
+                raise TypeError(
+                    f"Unsupported default type for key '{key}': {type(default)}"
+                )
+        return getter(self._get_entry(key), default)
+
+    @staticmethod
+    def _resolve(table: Dict[type, Any], value: Any) -> Any:
+        """Finds the accessor for subclasses of the supported types (eg.
+        numpy.float64), which miss the exact-type lookup."""
+        for cls in (bool, float, int, str):
+            if isinstance(value, cls):
+                return table[cls]
+        return None
@@ -0,0 +1,110 @@
+import numpy as np
+from wpilib import RobotController
+
+from .nettables import SmartNT
+
+
+class NumpyPIDBank:
+    """A bank of identical-form PID controllers (eg. the four drive or steer
+    controllers of a swerve drive) evaluated together as NumPy arrays, so a
+    whole bank costs a handful of vectorized operations per loop instead of
+    one `PIDController.calculate()` call per controller. Behaves like
+    wpimath's `PIDController`, including continuous input and the default
+    integrator range of [-1, 1]. It is recommended to create these using
+    `SmartProfile.create_pid_bank()`.
+    """
+
+    def __init__(
+        self,
+        kp,
+        ki,
+        kd,
+        size: int,
+        period: float = 0.02,
+        min_input: float = None,
+        max_input: float = None,
+        nt: SmartNT = None,
+        publish_period: float = 0.05,
+    ):
+        """
+        :param kp: Proportional gain, a scalar or one value per controller
+        :param ki: Integral gain, a scalar or one value per controller
+        :param kd: Derivative gain, a scalar or one value per controller
+        :param size: Number of controllers in the bank
+        :param period: Loop period in seconds
+        :param min_input: Minimum input for continuous input (optional)
+        :param max_input: Maximum input for continuous input (optional)
+        :param nt: Table to publish feedback arrays to, or None for no feedback
+        :param publish_period: Minimum time (seconds) between NT publishes
+        """
+        shape = (size,)
+        self.kp = np.broadcast_to(np.asarray(kp, dtype=float), shape).copy()
+        self.ki = np.broadcast_to(np.asarray(ki, dtype=float), shape).copy()
+        self.kd = np.broadcast_to(np.asarray(kd, dtype=float), shape).copy()
+        self.period = period
+        self._continuous = min_input is not None and max_input is not None
+        if self._continuous:
+            self._modulus = max_input - min_input
+            self._error_bound = self._modulus / 2.0
+        # integrator clamp of [-1, 1] / ki, unbounded where ki is zero
+        with np.errstate(divide="ignore"):
+            self._max_total = np.where(self.ki != 0, 1.0 / np.abs(self.ki), np.inf)
+        self._total_error = np.zeros(shape)
+        self.error = np.zeros(shape)
+        self.reference = np.zeros(shape)
+        self.measurement = np.zeros(shape)
+        self.output = np.zeros(shape)
+        self._nt = nt
+        self._publish_period = int(publish_period * 1e6)  # microseconds
+        self._last_publish = 0
+
+    def calculate(self, measurement, reference) -> np.ndarray:
+        """Returns the outputs of every controller in the bank.
+
+        :param measurement: Array (or sequence) of measurements
+        :param reference: Array (or sequence) of setpoints
+        """
+        measurement = np.asarray(measurement, dtype=float)
+        reference = np.asarray(reference, dtype=float)
+        error = reference - measurement
+        if self._continuous:
+            bound = self._error_bound
+            error = (error + bound) % self._modulus - bound
+        prev_error = self.error
+        total = self._total_error + error * self.period
+        np.clip(total, -self._max_total, self._max_total, out=total)
+        self._total_error = total
+        derivative = (error - prev_error) / self.period
+        self.output = self.kp * error + self.ki * total + self.kd * derivative
+        self.error = error
+        self.reference = reference
+        self.measurement = measurement
+        if self._nt is not None:
+            now = RobotController.getFPGATime()
+            if now - self._last_publish >= self._publish_period:
+                self._last_publish = now
+                self.flush()
+        return self.output
+
+    def reset(self) -> None:
+        """Clears the integral and previous error of every controller."""
+        self._total_error.fill(0.0)
+        self.error = np.zeros_like(self.error)
+
+    def getError(self) -> np.ndarray:
+        """Returns the current errors of the bank."""
+        return self.error
+
+    def getOutput(self) -> np.ndarray:
+        """Returns the current outputs of the bank."""
+        return self.output
+
+    def flush(self) -> None:
+        """Publishes the latest values to NetworkTables immediately."""
+        nt = self._nt
+        if nt is None:
+            return
+        nt.put_number_array("Reference", self.reference.tolist())
+        nt.put_number_array("Measurement", self.measurement.tolist())
+        nt.put_number_array("Error", self.error.tolist())
+        nt.put_number_array("Output", self.output.tolist())
@@ -1,5 +1,27 @@
+from ntcore import NetworkTableEntry, NetworkTableInstance
 from wpilib import Preferences, RobotController
 
+# (init, get, set) for each supported type; NT stores ints as doubles
+_DOUBLE_OPS = (
+    Preferences.initDouble,
+    NetworkTableEntry.getDouble,
+    NetworkTableEntry.setDouble,
+)
+_NT_OPS = {
+    int: _DOUBLE_OPS,
+    float: _DOUBLE_OPS,
+    str: (
+        Preferences.initString,
+        NetworkTableEntry.getString,
+        NetworkTableEntry.setString,
+    ),
+    bool: (
+        Preferences.initBoolean,
+        NetworkTableEntry.getBoolean,
+        NetworkTableEntry.setBoolean,
+    ),
+}
+
 
 class SmartPreference(object):
     """Wrapper for wpilib Preferences that improves it in a few ways:
@@ -31,32 +53,43 @@ class SmartPreference(object):
     ```
     """
 
+    __slots__ = (
+        "_value",
+        "_type",
+        "_entry",
+        "_init_fn",
+        "_get_fn",
+        "_set_fn",
+        "_low_bandwidth",
+        "_key",
+        "_last_nt_read",
+    )
+
     _changed_flag = False
     _CACHE_PERIOD = 250_000  # microseconds between NT reads
 
     def __init__(self, value) -> None:
         self._value = value
         self._type = type(value)
-        self._last_nt_read = 0.0
-        if self._type not in (int, float, str, bool):
+        self._entry = None
+        self._last_nt_read = 0
+        try:
+            self._init_fn, self._get_fn, self._set_fn = _NT_OPS[self._type]
+        except KeyError:
             raise TypeError(
                 f"SmartPreference must be int, float, str, or bool (not {self._type})"
-            )
+            ) from None
 
     def __set_name__(self, obj, name):
-        try:
-            self._low_bandwidth = obj.low_bandwidth
-        except:
-            self._low_bandwidth = False
+        self._low_bandwidth = getattr(obj, "low_bandwidth", False)
         self._key = name
         if self._low_bandwidth:
             return
-        if self._type is int or self._type is float:
-            Preferences.initDouble(self._key, self._value)
-        elif self._type is str:
-            Preferences.initString(self._key, self._value)
-        elif self._type is bool:
-            Preferences.initBoolean(self._key, self._value)
+        self._init_fn(name, self._value)
+        # Resolve the entry once so reads skip the Preferences key lookup
+        self._entry = (
+            NetworkTableInstance.getDefault().getTable("Preferences").getEntry(name)
+        )
 
     def __get__(self, obj, objtype=None):
         if self._low_bandwidth:
@@ -66,34 +99,24 @@ class SmartPreference(object):
         if now - self._last_nt_read < SmartPreference._CACHE_PERIOD:
             return self._value
         self._last_nt_read = now
-        new = None
-        if self._type is int or self._type is float:
-            new = Preferences.getDouble(self._key, self._value)
-        elif self._type is str:
-            new = Preferences.getString(self._key, self._value)
-        elif self._type is bool:
-            new = Preferences.getBoolean(self._key, self._value)
+        new = self._get_fn(self._entry, self._value)
         if new != self._value:
             SmartPreference._changed_flag = True
             self._value = new
         return self._value
 
     def __set__(self, obj, value):
-        if type(value) is not self._type:
+        # bool subclasses int, so keep True/False out of numeric preferences
+        if not isinstance(value, self._type) or (
+            isinstance(value, bool) and self._type is not bool
+        ):
             raise TypeError(
                 f"Set value type ({type(value)} does not match original ({self._type}))"
             )
         self._value = value
-        self._type = type(value)
         if self._low_bandwidth:
             return
-        if self._type is int or self._type is float:
-            Preferences.setDouble(self._key, self._value)
-        elif self._type is str:
-            Preferences.setString(self._key, self._value)
-        elif self._type is bool:
-            Preferences.setBoolean(self._key, self._value)
-        self._last_nt_read = RobotController.getFPGATime()  # Cache is fresh after set
+        self._set_fn(self._entry, value)
 
     def has_changed() -> bool:
         """Returns if any SmartPreference has changed since checked.
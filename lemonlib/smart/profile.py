@@ -1,3 +1,6 @@
+from functools import partial
+from typing import TYPE_CHECKING
+
 from phoenix6 import signals
 from phoenix6.configs import Slot0Configs
 from wpilib import Preferences, SmartDashboard
@@ -18,6 +21,9 @@ from wpiutil import Sendable, SendableBuilder
 from .controller import SmartController
 from .nettables import SmartNT
 
+if TYPE_CHECKING:
+    from .pidbank import NumpyPIDBank
+
 
 class SmartProfile(Sendable):
     """Used to store multiple gains and configuration values for several
@@ -28,8 +34,14 @@ class SmartProfile(Sendable):
     with the necessary gains. Please note that gains will NOT be
     dynamically updated in `SmartController` objects: therefore it is
     recommended to create a new `SmartController` object on enable.
+
+    Setting `SmartProfile.low_bandwidth = True` disables tuning for every
+    profile, regardless of `tuning_enabled`, so nothing is sent to or read
+    from NetworkTables.
     """
 
+    low_bandwidth = False
+
     def __init__(self, profile_key: str, gains: dict[str, float], tuning_enabled: bool):
         """Creates a SmartProfile.
         Recommended gain keys (for use with `SmartController`):
@@ -55,38 +67,47 @@ class SmartProfile(Sendable):
         Sendable.__init__(self)
         self.profile_key = profile_key
         self.nt = SmartNT(f"SmartProfile/{profile_key}")
-        self.tuning_enabled = tuning_enabled
+        self.tuning_enabled = tuning_enabled and not SmartProfile.low_bandwidth
         self.gains = gains
-        if tuning_enabled:
-            for gain in gains:
-                Preferences.initDouble(f"{profile_key}_{gain}", gains[gain])
-                self.gains[gain] = Preferences.getDouble(
-                    f"{profile_key}_{gain}", gains[gain]
-                )
+        self._nt_keys = {gain: f"{profile_key}_{gain}" for gain in gains}
+        # gain keys never change after construction (only their values do)
+        self._has_continuous = "kMinInput" in gains and "kMaxInput" in gains
+        if self.tuning_enabled:
+            for gain, nt_key in self._nt_keys.items():
+                Preferences.initDouble(nt_key, gains[gain])
+                self.gains[gain] = Preferences.getDouble(nt_key, gains[gain])
             SmartDashboard.putData(f"SmartProfile/{profile_key}", self)
 
     def initSendable(self, builder: SendableBuilder):
         builder.setSmartDashboardType("SmartController")
+        # partials over bound methods avoid a Python frame per NT poll
+        get_gain = self.gains.__getitem__
         for gain_key in self.gains:
             builder.addDoubleProperty(
                 gain_key,
-                (lambda key=gain_key: self.gains[key]),
-                (lambda value, key=gain_key: self._set_gain(key, value)),
+                partial(get_gain, gain_key),
+                partial(self._set_gain, gain_key),
             )
 
     def _set_gain(self, key: str, value: float):
         self.gains[key] = value
         if self.tuning_enabled:
-            Preferences.setDouble(f"{self.profile_key}_{key}", value)
+            Preferences.setDouble(self._nt_keys[key], value)
+
+    def _enable_continuous_input(self, controller) -> None:
+        if self._has_continuous:
+            controller.enableContinuousInput(
+                self.gains["kMinInput"], self.gains["kMaxInput"]
+            )
 
     def _requires(requirements: set[str]):
         def inner(func):
-            def wrapper(self, key, feedback_enabled=None):
-                missing_reqs = requirements - set(self.gains.keys())
+            def wrapper(self, *args, **kwargs):
+                missing_reqs = requirements.difference(self.gains)
                 assert (
                     len(missing_reqs) == 0
                 ), f"Requires gains: {', '.join(missing_reqs)}"
-                return func(self, key, feedback_enabled)
+                return func(self, *args, **kwargs)
 
             return wrapper
 
@@ -100,26 +121,48 @@ class SmartProfile(Sendable):
         Requires kP, kI, kD, [kMinInput, kMaxInput optional]
         """
         controller = PIDController(self.gains["kP"], self.gains["kI"], self.gains["kD"])
-        if "kMinInput" in self.gains.keys() and "kMaxInput" in self.gains.keys():
-            controller.enableContinuousInput(
-                self.gains["kMinInput"], self.gains["kMaxInput"]
-            )
+        self._enable_continuous_input(controller)
         return SmartController(
             key,
-            (lambda y, r: controller.calculate(y, r)),
+            controller.calculate,
             self.tuning_enabled if feedback_enabled is None else feedback_enabled,
         )
 
+    @_requires({"kP", "kI", "kD"})
+    def create_pid_bank(
+        self, key: str, size: int, feedback_enabled: bool = None, period: float = 0.02
+    ) -> "NumpyPIDBank":
+        """Creates a bank of `size` PID controllers sharing these gains,
+        evaluated together with NumPy (which must be installed).
+        Requires kP, kI, kD, [kMinInput, kMaxInput optional]
+        """
+        from .pidbank import NumpyPIDBank
+
+        g = self.gains
+        if feedback_enabled is None:
+            feedback_enabled = self.tuning_enabled
+        if feedback_enabled and not SmartController.low_bandwidth:
+            nt = SmartNT(f"SmartController/{key}_bank")
+        else:
+            nt = None
+        return NumpyPIDBank(
+            g["kP"],
+            g["kI"],
+            g["kD"],
+            size,
+            period,
+            g["kMinInput"] if self._has_continuous else None,
+            g["kMaxInput"] if self._has_continuous else None,
+            nt,
+        )
+
     def create_wpi_pid_controller(self) -> PIDController:
         """Creates a wpilib PIDController. Use `create_pid_controller()`
         instead if possible.
         Requires kP, kI, kD, [kMinInput, kMaxInput optional]
         """
         controller = PIDController(self.gains["kP"], self.gains["kI"], self.gains["kD"])
-        if "kMinInput" in self.gains.keys() and "kMaxInput" in self.gains.keys():
-            controller.enableContinuousInput(
-                self.gains["kMinInput"], self.gains["kMaxInput"]
-            )
+        self._enable_continuous_input(controller)
         return controller
 
     def create_ctre_pid_controller(self) -> Slot0Configs:
@@ -220,13 +263,10 @@ class SmartProfile(Sendable):
             self.gains["kD"],
             TrapezoidProfile.Constraints(self.gains["kMaxV"], self.gains["kMaxA"]),
         )
-        if "kMinInput" in self.gains.keys() and "kMaxInput" in self.gains.keys():
-            controller.enableContinuousInput(
-                self.gains["kMinInput"], self.gains["kMaxInput"]
-            )
+        self._enable_continuous_input(controller)
         return SmartController(
             key,
-            (lambda y, r: controller.calculate(y, r)),
+            controller.calculate,
             self.tuning_enabled if feedback_enabled is None else feedback_enabled,
         )
 
@@ -269,15 +309,14 @@ class SmartProfile(Sendable):
         """Creates a simple DC motor feedforward controller.
         Requires kS, kV, [kA optional]
         """
-        controller = SimpleMotorFeedforwardMeters(
-            self.gains["kS"],
-            self.gains["kV"],
-            self.gains["kA"] if "kA" in self.gains else 0,
-        )
+        g = self.gains
+        controller = SimpleMotorFeedforwardMeters(g["kS"], g["kV"], g.get("kA", 0))
+        ff_calc = controller.calculate
         return SmartController(
             key,
-            (lambda y, r: controller.calculate(r)),
+            (lambda y, r: ff_calc(r)),
             self.tuning_enabled if feedback_enabled is None else feedback_enabled,
+            assume_pure=True,
         )
 
     @_requires({"kP", "kI", "kD", "kS", "kV"})
@@ -287,17 +326,16 @@ class SmartProfile(Sendable):
         """Creates a PID controller combined with a DC motor feedforward controller.
         Requires kP, kI, kD, kS, kV, [kA optional]
         """
-        pid = PIDController(self.gains["kP"], self.gains["kI"], self.gains["kD"])
-        if "kMinInput" in self.gains.keys() and "kMaxInput" in self.gains.keys():
-            pid.enableContinuousInput(self.gains["kMinInput"], self.gains["kMaxInput"])
-        feedforward = SimpleMotorFeedforwardMeters(
-            self.gains["kS"],
-            self.gains["kV"],
-            self.gains["kA"] if "kA" in self.gains else 0,
-        )
+        g = self.gains
+        pid = PIDController(g["kP"], g["kI"], g["kD"])
+        self._enable_continuous_input(pid)
+        feedforward = SimpleMotorFeedforwardMeters(g["kS"], g["kV"], g.get("kA", 0))
+        # bind methods once so the closure only touches local cells
+        pid_calc = pid.calculate
+        ff_calc = feedforward.calculate
         return SmartController(
             key,
-            (lambda y, r: pid.calculate(y, r) + feedforward.calculate(r)),
+            (lambda y, r: pid_calc(y, r) + ff_calc(r)),
             self.tuning_enabled if feedback_enabled is None else feedback_enabled,
         )
 
@@ -308,26 +346,22 @@ class SmartProfile(Sendable):
         """Creates a profiled PID controller combined with a DC motor feedforward controller.
         Requires kP, kI, kD, kS, kV, [kA, kMinInput, kMaxInput optional]
         """
+        g = self.gains
         pid = ProfiledPIDController(
-            self.gains["kP"],
-            self.gains["kI"],
-            self.gains["kD"],
-            TrapezoidProfile.Constraints(self.gains["kMaxV"], self.gains["kMaxA"]),
-        )
-        if "kMinInput" in self.gains.keys() and "kMaxInput" in self.gains.keys():
-            pid.enableContinuousInput(self.gains["kMinInput"], self.gains["kMaxInput"])
-        feedforward = SimpleMotorFeedforwardMeters(
-            self.gains["kS"],
-            self.gains["kV"],
-            self.gains["kA"] if "kA" in self.gains else 0,
+            g["kP"],
+            g["kI"],
+            g["kD"],
+            TrapezoidProfile.Constraints(g["kMaxV"], g["kMaxA"]),
         )
+        self._enable_continuous_input(pid)
+        feedforward = SimpleMotorFeedforwardMeters(g["kS"], g["kV"], g.get("kA", 0))
+        pid_calc = pid.calculate
+        pid_setpoint = pid.getSetpoint
+        ff_calc = feedforward.calculate
 
         def calculate(y, r):
-            pid_output = pid.calculate(y, r)
-            setpoint = pid.getSetpoint()
             # add acceleration eventually
-            feedforward_output = feedforward.calculate(setpoint.velocity)
-            return pid_output + feedforward_output
+            return pid_calc(y, r) + ff_calc(pid_setpoint().velocity)
 
         return SmartController(
             key,
@@ -342,25 +376,21 @@ class SmartProfile(Sendable):
         """Creates a profiled PID controller combined with an elevator feedforward controller.
         Requires kP, kI, kD, kS, kV, kG, [kA optional]
         """
+        g = self.gains
         pid = ProfiledPIDController(
-            self.gains["kP"],
-            self.gains["kI"],
-            self.gains["kD"],
-            TrapezoidProfile.Constraints(self.gains["kMaxV"], self.gains["kMaxA"]),
-        )
-        feedforward = ElevatorFeedforward(
-            self.gains["kS"],
-            self.gains["kG"],
-            self.gains["kV"],
-            self.gains["kA"] if "kA" in self.gains else 0,
+            g["kP"],
+            g["kI"],
+            g["kD"],
+            TrapezoidProfile.Constraints(g["kMaxV"], g["kMaxA"]),
         )
+        feedforward = ElevatorFeedforward(g["kS"], g["kG"], g["kV"], g.get("kA", 0))
+        pid_calc = pid.calculate
+        pid_setpoint = pid.getSetpoint
+        ff_calc = feedforward.calculate
 
         def calculate(y, r):
-            pid_output = pid.calculate(y, r)
-            setpoint = pid.getSetpoint()
             # add acceleration eventually
-            feedforward_output = feedforward.calculate(setpoint.velocity)
-            return pid_output + feedforward_output
+            return pid_calc(y, r) + ff_calc(pid_setpoint().velocity)
 
         return SmartController(
             key,
@@ -375,30 +405,23 @@ class SmartProfile(Sendable):
         """Creates a profiled PID controller combined with an arm feedforward controller.
         Requires kP, kI, kD, kS, kV, kG, [kA optional]
         """
+        g = self.gains
         pid = ProfiledPIDController(
-            self.gains["kP"],
-            self.gains["kI"],
-            self.gains["kD"],
-            TrapezoidProfile.Constraints(self.gains["kMaxV"], self.gains["kMaxA"]),
-        )
-        feedforward = ArmFeedforward(
-            self.gains["kS"],
-            self.gains["kG"],
-            self.gains["kV"],
-            self.gains["kA"] if "kA" in self.gains else 0,
+            g["kP"],
+            g["kI"],
+            g["kD"],
+            TrapezoidProfile.Constraints(g["kMaxV"], g["kMaxA"]),
         )
+        feedforward = ArmFeedforward(g["kS"], g["kG"], g["kV"], g.get("kA", 0))
+        pid_calc = pid.calculate
+        pid_setpoint = pid.getSetpoint
+        ff_calc = feedforward.calculate
 
-        def calculate(
-            y,
-            r,
-        ):
-            pid_output = pid.calculate(y, r)
-            setpoint = pid.getSetpoint()
+        def calculate(y, r):
+            pid_output = pid_calc(y, r)
+            setpoint = pid_setpoint()
             # add acceleration eventually
-            feedforward_output = feedforward.calculate(
-                setpoint.position, setpoint.velocity
-            )
-            return pid_output + feedforward_output
+            return pid_output + ff_calc(setpoint.position, setpoint.velocity)
 
         return SmartController(
             key,
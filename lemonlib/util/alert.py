@@ -1,11 +1,12 @@
+import logging
 from enum import Enum
 from logging import Logger
-from typing import List
+from typing import Dict, List
 
 from wpilib import DriverStation, SmartDashboard, Timer
 from wpiutil import Sendable, SendableBuilder
 
-from .elastic import Notification, send_notification
+from .elastic import Notification, _publish_notification
 
 
 class AlertType(Enum):
@@ -18,6 +19,21 @@ class AlertType(Enum):
     INFO = 2
 
 
+_LOG_LEVELS = {
+    AlertType.ERROR: logging.ERROR,
+    AlertType.WARNING: logging.WARNING,
+    AlertType.INFO: logging.INFO,
+}
+
+_fallback_logger = logging.getLogger(__name__)
+
+
+def _log(type: AlertType, text: str) -> None:
+    # alerts may fire before an AlertManager has installed its logger
+    logger = AlertManager.logger or _fallback_logger
+    logger.log(_LOG_LEVELS[type], text)
+
+
 class Alert:
     """
     Represents an individual alert with text, type, and optional timeout.
@@ -25,6 +41,18 @@ class Alert:
     Alerts can be activated, deactivated, or updated with new text.
     """
 
+    __slots__ = (
+        "text",
+        "type",
+        "timeout",
+        "active",
+        "active_start_time",
+        "last_log",
+        "elasticnoti",
+        "_notification_key",
+        "_notification_json",
+    )
+
     def __init__(
         self, text: str, type: AlertType, timeout: float = 0.0, elasticnoti: bool = True
     ):
@@ -45,6 +73,8 @@ class Alert:
         self.last_log = 0.0
         AlertManager.alerts.append(self)
         self.elasticnoti = elasticnoti
+        self._notification_key = None
+        self._notification_json = ""
 
     def set(self, active: bool):
         """
@@ -57,23 +87,31 @@ class Alert:
             self.active_start_time = Timer.getFPGATimestamp()
 
             # Log the alert based on its type.
-            match self.type:
-                case AlertType.ERROR.value:
-                    AlertManager.logger.error(self.text)
-                case AlertType.WARNING.value:
-                    AlertManager.logger.warning(self.text)
-                case AlertType.INFO.value:
-                    AlertManager.logger.info(self.text)
-
-            # Send notification to Elastic dashboard.
-            notification = Notification(
-                level=self.type.name,
-                title="Robot Alert",
-                description=self.text,
-                display_time=int(self.timeout * 1000) if self.timeout > 0 else 3000,
-            )
+            _log(self.type, self.text)
+
+            # Send notification to Elastic dashboard, reusing the serialized
+            # payload while the text and timeout are unchanged.
             if self.elasticnoti:
-                send_notification(notification)
+                key = (self.text, self.timeout)
+                if key != self._notification_key:
+                    self._notification_key = key
+                    self._notification_json = Notification(
+                        level=self.type.name,
+                        title="Robot Alert",
+                        description=self.text,
+                        display_time=(
+                            int(self.timeout * 1000) if self.timeout > 0 else 3000
+                        ),
+                    ).to_json()
+                _publish_notification(self._notification_json)
+
+            # activation times only increase, so appending keeps each
+            # active list ordered by active_start_time
+            AlertManager._active[self.type].append(self)
+            AlertManager._strings_time = float("-inf")
+        elif self.active and not active:
+            AlertManager._active[self.type].remove(self)
+            AlertManager._strings_time = float("-inf")
 
         self.active = active
 
@@ -96,19 +134,13 @@ class Alert:
         Args:
             text (str): New text for the alert.
         """
-        if (
-            self.active
-            and self.text != text
-            and Timer.getFPGATimestamp() - self.last_log > 1.0
-        ):
-            self.last_log = Timer.getFPGATimestamp()
-            match self.type:
-                case AlertType.ERROR:
-                    AlertManager.logger.error(text)
-                case AlertType.WARNING:
-                    AlertManager.logger.warning(text)
-                case AlertType.INFO:
-                    AlertManager.logger.info(text)
+        if self.active and self.text != text:
+            now = Timer.getFPGATimestamp()
+            if now - self.last_log > 1.0:
+                self.last_log = now
+                _log(self.type, text)
+            # the cached string lists hold the old text
+            AlertManager._strings_time = float("-inf")
         self.text = text
 
 
@@ -120,6 +152,13 @@ class AlertManager(Sendable):
     alerts: List[Alert] = []
     logger: Logger = None
 
+    # the dashboard polls all three types back to back, so one pass fills
+    # every bucket and the other two polls reuse it
+    _active: Dict[AlertType, List[Alert]] = {t: [] for t in AlertType}
+    _strings: Dict[AlertType, List[str]] = {}
+    _strings_time = float("-inf")
+    _strings_max_age = 0.02  # seconds
+
     def __init__(self, logger, enabled: bool = True):
         """
         Initialize the AlertManager.
@@ -151,6 +190,7 @@ class AlertManager(Sendable):
     def get_strings(type: AlertType) -> List[str]:
         """
         Retrieve active alerts of a specified type as strings.
+        All types are refreshed together, at most once every 20 ms.
 
         Args:
             type (AlertType): The type of alerts to retrieve.
@@ -158,23 +198,29 @@ class AlertManager(Sendable):
         Returns:
             List[str]: List of alert messages.
         """
-        alerts = []
         timestamp = Timer.getFPGATimestamp()
-        for alert in AlertManager.alerts:
-            if not alert.active:
-                continue
-            if (
-                alert.timeout > 0.0
-                and timestamp - alert.active_start_time >= alert.timeout
-            ):
+        if timestamp - AlertManager._strings_time >= AlertManager._strings_max_age:
+            AlertManager._refresh_strings(timestamp)
+        return AlertManager._strings[type]
+
+    @staticmethod
+    def _refresh_strings(timestamp: float) -> None:
+        """Expires timed out alerts and rebuilds the sorted text of every type."""
+        strings: Dict[AlertType, List[str]] = {}
+        for type, active in AlertManager._active.items():
+            texts = []
+            expired = []
+            for alert in active:
+                timeout = alert.timeout
+                if timeout > 0.0 and timestamp - alert.active_start_time >= timeout:
+                    expired.append(alert)
+                else:
+                    texts.append(alert.text)
+            for alert in expired:
                 alert.set(False)
-                continue
-            if alert.type == type:
-                alerts.append(alert)
-        return [
-            alert.text
-            for alert in sorted(alerts, key=lambda alert: alert.active_start_time)
-        ]
+            strings[type] = texts
+        AlertManager._strings = strings
+        AlertManager._strings_time = timestamp
 
     @staticmethod
     def instant_alert(text: str, type: AlertType, timeout: float = 0.0):
@@ -15,6 +15,8 @@ class NotificationLevel(Enum):
 class Notification:
     """Represents an notification with various display properties."""
 
+    __slots__ = ("level", "title", "description", "display_time", "width", "height")
+
     def __init__(
         self,
         level=NotificationLevel.INFO,
@@ -42,6 +44,22 @@ class Notification:
         self.width = width
         self.height = height
 
+    def to_json(self) -> str:
+        """Serializes the notification in the format Elastic expects."""
+        level = self.level
+        if isinstance(level, NotificationLevel):
+            level = level.value
+        return json.dumps(
+            {
+                "level": level,
+                "title": self.title,
+                "description": self.description,
+                "displayTime": self.display_time,
+                "width": self.width,
+                "height": self.height,
+            }
+        )
+
 
 __selected_tab_topic = None
 __selected_tab_publisher = None
@@ -61,6 +79,16 @@ def send_notification(notification: Notification):
     Raises:
         Exception: If there is an error during serialization or publishing the notification.
     """
+    try:
+        payload = notification.to_json()
+    except Exception as e:
+        print(f"Error serializing notification: {e}")
+        return
+    _publish_notification(payload)
+
+
+def _publish_notification(payload: str):
+    """Publishes an already serialized notification."""
     global __notification_topic
     global __notification_publisher
 
@@ -73,21 +101,7 @@ def send_notification(notification: Notification):
             PubSubOptions(sendAll=True, keepDuplicates=True)
         )
 
-    try:
-        __notification_publisher.set(
-            json.dumps(
-                {
-                    "level": notification.level,
-                    "title": notification.title,
-                    "description": notification.description,
-                    "displayTime": notification.display_time,
-                    "width": notification.width,
-                    "height": notification.height,
-                }
-            )
-        )
-    except Exception as e:
-        print(f"Error serializing notification: {e}")
+    __notification_publisher.set(payload)
 
 
 def select_tab(tab_name: str):
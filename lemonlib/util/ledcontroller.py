@@ -4,14 +4,24 @@ from typing import Tuple
 import wpimath.units
 from wpilib import AddressableLED, Color, LEDPattern, RobotController, Timer
 
+# RGB for every whole-degree hue at full saturation and 50% brightness,
+# so the rainbow presets index a table instead of calling hsv_to_rgb per LED
+_RAINBOW_LUT = tuple(
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb(hue / 360.0, 1.0, 0.5))
+    for hue in range(360)
+)
+
 
 class LEDController:
-    def __init__(self, pwm_port: int, length: int):
+    def __init__(self, pwm_port: int, length: int, auto_flush: bool = True):
         """
         Initializes the LED controller.
 
         :param pwm_port: The PWM port the LED strip is connected to.
         :param length: Number of LEDs in the strip.
+        :param auto_flush: Send the buffer to the strip after every change.
+            When False, changes only mark the buffer dirty and `flush()`
+            must be called once per loop to send them.
         """
         self.led = AddressableLED(pwm_port)
         self.length = length
@@ -20,9 +30,25 @@ class LEDController:
         self.led.setLength(length)
         self.led.setData(self.buffer)
         self.led.start()
+        self.auto_flush = auto_flush
+        self._dirty = False
         self.solid_color = None
+        self.gradient = None
         self._move_frame_initialized = False
         self._last_lit_indices: list[int] = []
+        self._block_color_indices: dict[tuple[int, int], list[int]] = {}
+
+    def _show(self):
+        if self.auto_flush:
+            self.led.setData(self.buffer)
+        else:
+            self._dirty = True
+
+    def flush(self):
+        """Sends the buffer to the strip if it changed since the last flush."""
+        if self._dirty:
+            self._dirty = False
+            self.led.setData(self.buffer)
 
     def _reset_move_cache(self):
         self._move_frame_initialized = False
@@ -36,8 +62,9 @@ class LEDController:
         """Applies a wpilib.LEDPattern to the LED buffer and updates the strip."""
         self._reset_move_cache()
         self.solid_color = None
+        self.gradient = None
         pattern.applyTo(self.buffer, self._write_data)
-        self.led.setData(self.buffer)
+        self._show()
 
     def _write_data(self, index: int, color: Color):
         self.buffer[index].setLED(color)
@@ -48,36 +75,47 @@ class LEDController:
             return
         self._reset_move_cache()
         self.solid_color = color
+        self.gradient = None
         r, g, b = color
         for led in self.buffer:
             led.setRGB(r, g, b)
-        self.led.setData(self.buffer)
+        self._show()
 
     def set_pixel(self, index: int, color: Tuple[int, int, int]):
         """Sets the color of a single LED pixel."""
         self._reset_move_cache()
         self.solid_color = None
+        self.gradient = None
         r, g, b = color
         self.buffer[index].setRGB(r, g, b)
-        self.led.setData(self.buffer)
+        self._show()
 
     def set_gradient(
         self, start_color: Tuple[int, int, int], end_color: Tuple[int, int, int]
     ):
         """Custom preset that Sets a gradient from start_color to end_color across the LED strip."""
+        gradient = (start_color, end_color)
+        if gradient == self.gradient:
+            return
         self._reset_move_cache()
         start_r, start_g, start_b = start_color
         end_r, end_g, end_b = end_color
+        delta_r = end_r - start_r
+        delta_g = end_g - start_g
+        delta_b = end_b - start_b
         length = self.length
+        last = max(length - 1, 1)
         buffer = self.buffer
         for i in range(length):
-            factor = i / (length - 1) if length > 1 else 0
-            r = int(start_r + factor * (end_r - start_r))
-            g = int(start_g + factor * (end_g - start_g))
-            b = int(start_b + factor * (end_b - start_b))
-            buffer[i].setRGB(r, g, b)
-        self.led.setData(buffer)
+            factor = i / last
+            buffer[i].setRGB(
+                int(start_r + factor * delta_r),
+                int(start_g + factor * delta_g),
+                int(start_b + factor * delta_b),
+            )
+        self._show()
         self.solid_color = None
+        self.gradient = gradient
 
     def static_rainbow(self, offset: int = 0):
         """Custom preset that Creates a rainbow effect across the LED strip.
@@ -86,36 +124,24 @@ class LEDController:
         """
         self._reset_move_cache()
         length = self.length
-        inv_length = 1.0 / length
-        hue_offset = offset / 360.0
+        degrees_per_led = 360.0 / length
+        lut = _RAINBOW_LUT
         buffer = self.buffer
         for i in range(length):
-            # Normalize index to [0,1] and add the offset (converted from degrees)
-            hue = ((i * inv_length) + hue_offset) % 1.0
-            # Convert HSV to RGB; using full saturation and 50% brightness
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 0.5)
-            buffer[i].setRGB(int(r * 255), int(g * 255), int(b * 255))
-        self.led.setData(buffer)
+            # Spread the hues over the strip and add the offset (in degrees)
+            r, g, b = lut[int(i * degrees_per_led + offset) % 360]
+            buffer[i].setRGB(r, g, b)
+        self._show()
         self.solid_color = None
+        self.gradient = None
 
     def scolling_rainbow(self, speed: float = 1):
         """Custom preset that Creates a rainbow effect across the LED strip.
 
         The offset parameter (in degrees) can be used to animate the rainbow.
         """
-        self._reset_move_cache()
-        length = self.length
-        inv_length = 1.0 / length
-        time_offset = (((RobotController.getTime() / 100000) * speed) / 360.0) % 1.0
-        buffer = self.buffer
-        for i in range(length):
-            # Normalize index to [0,1] and add the offset (converted from degrees)
-            hue = ((i * inv_length) + time_offset) % 1.0
-            # Convert HSV to RGB; using full saturation and 50% brightness
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 0.5)
-            buffer[i].setRGB(int(r * 255), int(g * 255), int(b * 255))
-        self.led.setData(buffer)
-        self.solid_color = None
+        # same hue table as static_rainbow, shifted by the elapsed time
+        self.static_rainbow(((RobotController.getTime() / 100000) * speed) % 360.0)
 
     def move_across(
         self,
@@ -155,7 +181,8 @@ class LEDController:
 
         self._last_lit_indices = current_lit
         self.solid_color = None
-        self.led.setData(buffer)
+        self.gradient = None
+        self._show()
 
     def move_across_multi(
         self,
@@ -184,11 +211,19 @@ class LEDController:
             for idx in self._last_lit_indices:
                 buffer[idx].setRGB(0, 0, 0)
 
+        # Which color each LED of the block uses only depends on the block
+        # size and color count, so the table is built once per combination
+        key = (size, num_colors)
+        color_indices = self._block_color_indices.get(key)
+        if color_indices is None:
+            color_indices = [
+                int((i / size) * num_colors) % num_colors for i in range(size)
+            ]
+            self._block_color_indices[key] = color_indices
+
         # Fill the moving block with a color pattern distributed across its size
         current_lit: list[int] = []
-        for i in range(size):
-            # Determine which color to use for this LED in the block
-            color_index = int((i / size) * num_colors) % num_colors
+        for i, color_index in enumerate(color_indices):
             r, g, b = colors[color_index]
 
             index = (position + i) % length
@@ -196,8 +231,9 @@ class LEDController:
             current_lit.append(index)
 
         self._last_lit_indices = current_lit
-        self.led.setData(buffer)
+        self._show()
         self.solid_color = None
+        self.gradient = None
 
     def blink(
         self,
@@ -222,4 +258,5 @@ class LEDController:
         """Turns off all LEDs."""
         self._reset_move_cache()
         self.solid_color = None
+        self.gradient = None
         self.set_solid_color((0, 0, 0))
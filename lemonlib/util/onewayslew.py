@@ -16,7 +16,7 @@ class OneWaySlewRateLimiter:
     is acceptable, but large negative steps must be smoothed.
     """
 
-    __slots__ = ("fallRate", "prev")
+    __slots__ = ("fallRate", "prev", "prevTime")
 
     def __init__(self, rateLimit: float) -> None:
         """
@@ -30,6 +30,7 @@ class OneWaySlewRateLimiter:
             raise ValueError("rateLimit must be positive")
         self.fallRate = -abs(rateLimit)  # negative per second
         self.prev = 0.0
+        self.prevTime = RobotController.getFPGATime()  # microseconds
 
     def calculate(self, input: float) -> float:
         """
@@ -37,17 +38,18 @@ class OneWaySlewRateLimiter:
         slew rate. Positive changes are applied immediately.
 
         :param input: Input value.
-        :param dt:    Time step in seconds.
 
         :returns: The filtered value.
         """
         prev = self.prev
-        time = RobotController.getFPGATime() * 1e-6
+        now = RobotController.getFPGATime()
+        elapsed = (now - self.prevTime) * 1e-6
+        self.prevTime = now
         if input >= prev:
             self.prev = input
             return input
 
-        max_neg_delta = self.fallRate * time
+        max_neg_delta = self.fallRate * elapsed
         candidate = prev + max_neg_delta
 
         if candidate > input:
@@ -73,3 +75,4 @@ class OneWaySlewRateLimiter:
         :param value: New stored value.
         """
         self.prev = float(value)
+        self.prevTime = RobotController.getFPGATime()
@@ -1,3 +1,4 @@
+import math
 from typing import Callable
 from wpilib import DriverStation
 from magicbot import feedback
@@ -6,7 +7,12 @@ from pathlib import Path
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
     """Restrict value between min_value and max_value."""
-    return max(min(value, max_value), min_value)
+    # plain comparisons avoid two builtin calls per clamp
+    if value < min_value:
+        return min_value
+    if value > max_value:
+        return max_value
+    return value
 
 
 def is_red() -> bool:
@@ -38,16 +44,37 @@ def curve(
         If false, adds sign(input_val) * offset or 0 in the deadband
     """
 
-    def f(input_val: float) -> float:
-        """Apply a curve to an input. Be sure to call this function to get an output, not curve."""
-        if abs(input_val) < deadband:
-            return offset if absolute_offset else 0
-        applied_offset = (1 if absolute_offset else abs(input_val) / input_val) * offset
-        output_val = mapping(input_val) + applied_offset
-        if max_mag == 0:
+    # an unrestricted curve clamps to +-inf, which never triggers, so the
+    # closure needs no max_mag == 0 check or clamp() call
+    upper = max_mag if max_mag != 0 else math.inf
+    lower = -upper
+
+    # absolute_offset never changes, so pick the closure for it up front
+    if absolute_offset:
+
+        def f(input_val: float) -> float:
+            """Apply a curve to an input. Be sure to call this function to get an output, not curve."""
+            if abs(input_val) < deadband:
+                return offset
+            output_val = mapping(input_val) + offset
+            if output_val < lower:
+                return lower
+            if output_val > upper:
+                return upper
+            return output_val
+
+    else:
+
+        def f(input_val: float) -> float:
+            """Apply a curve to an input. Be sure to call this function to get an output, not curve."""
+            if abs(input_val) < deadband:
+                return 0
+            output_val = mapping(input_val) + math.copysign(1.0, input_val) * offset
+            if output_val < lower:
+                return lower
+            if output_val > upper:
+                return upper
             return output_val
-        else:
-            return clamp(output_val, -max_mag, max_mag)
 
     return f
 
@@ -85,12 +112,13 @@ def cubic_curve(
 
 
 def SnapX(x, y) -> float:
-    if abs(x) > abs(y):
+    # comparing squares orders magnitudes without two abs() calls
+    if x * x > y * y:
         return x
     return 0.0
 
 
 def SnapY(x, y) -> float:
-    if abs(y) > abs(x):
+    if y * y > x * x:
         return y
     return 0.0
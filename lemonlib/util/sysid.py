@@ -1,8 +1,14 @@
-from commands2.sysid import SysIdRoutine
+from typing import TYPE_CHECKING
+
 from magicbot import will_reset_to
 from wpilib import Timer
 from wpilib.sysid import State, SysIdRoutineLog
 
+if TYPE_CHECKING:
+    # only needed for annotations; importing commands2 costs ~14 ms at
+    # startup for robots that never run SysId
+    from commands2.sysid import SysIdRoutine
+
 
 class MagicSysIdRoutine:
     """Magicbot implementation of SysIdRoutine from commands2.
@@ -54,7 +60,7 @@ class MagicSysIdRoutine:
         self.state = State.kNone
 
     def setup_sysid(
-        self, config: SysIdRoutine.Config, mechanism: SysIdRoutine.Mechanism
+        self, config: "SysIdRoutine.Config", mechanism: "SysIdRoutine.Mechanism"
     ):
         self.log = SysIdRoutineLog(mechanism.name)
         self.config = config
@@ -64,22 +70,22 @@ class MagicSysIdRoutine:
     def quasistatic_forward(self):
         self.enabled = True
         self.state = State.kQuasistaticForward
-        self.outputVolts = self.timer.get() * self.config.rampRate
+        self.output_volts = self.timer.get() * self.config.rampRate
 
     def quasistatic_reverse(self):
         self.enabled = True
         self.state = State.kQuasistaticReverse
-        self.outputVolts = -self.timer.get() * self.config.rampRate
+        self.output_volts = -self.timer.get() * self.config.rampRate
 
     def dynamic_forward(self):
         self.enabled = True
         self.state = State.kDynamicForward
-        self.outputVolts = self.config.stepVoltage
+        self.output_volts = self.config.stepVoltage
 
     def dynamic_reverse(self):
         self.enabled = True
         self.state = State.kDynamicReverse
-        self.outputVolts = -self.config.stepVoltage
+        self.output_volts = -self.config.stepVoltage
 
     def on_start(self):
         self.timer.restart()
@@ -112,6 +118,6 @@ class MagicSysIdRoutine:
             self.timed_out = True
             return
 
-        self.mechanism.drive(self.outputVolts)
+        self.mechanism.drive(self.output_volts)
         self.mechanism.log(self.log)
         self.record_state(self.state)
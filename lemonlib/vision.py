@@ -22,6 +22,7 @@ class LemonCamera(PhotonCamera):
         self.camera_to_bot = camera_to_bot
         self.april_tag_field = april_tag_field
         setVersionCheckEnabled(version_check)
+        self.results = []
 
     def update(self):
         self.results = self.getAllUnreadResults()